@@ -1,12 +1,10 @@
 """Sphinx documentation configuration file."""
 from datetime import datetime
 import os
+from pathlib import Path
 
-import ansys.mechanical.core
 from ansys_sphinx_theme import ansys_favicon
 from ansys_sphinx_theme import pyansys_logo_black as logo
-import numpy as np
-import pyvista
 from sphinx_gallery.sorting import FileNameSortKey
 
 # Project information
@@ -40,6 +38,10 @@ html_theme_options = {
 }
 
 # Sphinx extensions
+# The documentation is built in parallel: ``doc/Makefile`` and ``doc/make.bat``
+# pass ``-j auto`` to ``sphinx-build`` by default. Override it through the
+# ``SPHINXOPTS`` environment variable, e.g. ``SPHINXOPTS="-j 1"``. ``tox -e doc``
+# always builds with ``-j auto``.
 extensions = [
     "jupyter_sphinx",
     "notfound.extension",
@@ -57,8 +59,9 @@ extensions = [
 
 # -- Sphinx Gallery Options ---------------------------------------------------
 sphinx_gallery_conf = {
-    # convert rst to md for ipynb
-    "pypandoc": True,
+    # convert rst to md for ipynb. This starts pandoc for every example; set
+    # PYMECHANICAL_GALLERY_PYPANDOC=0 to skip it when the notebooks are not needed.
+    "pypandoc": os.environ.get("PYMECHANICAL_GALLERY_PYPANDOC", "1") == "1",
     # path to your examples scripts
     "examples_dirs": ["../../examples/basic"],
     # path where to save gallery generated examples
@@ -74,8 +77,15 @@ sphinx_gallery_conf = {
     # Modules for which function level galleries are created. In
     "doc_module": "ansys-mapdl-core",
     "image_scrapers": ("pyvista", "matplotlib"),
-    "ignore_pattern": "flycheck*",
+    # Skip editor backups and private helper modules such as ``__init__.py``
+    "ignore_pattern": r"flycheck*|[\\/]_\w*\.py$",
     "thumbnail_size": (350, 350),
+    # Only re-execute examples whose source changed since the last build (the
+    # cached output is reused otherwise). Set PYMECHANICAL_GALLERY_INCREMENTAL=0
+    # to force every example to run again.
+    "run_stale_examples": (
+        os.environ.get("PYMECHANICAL_GALLERY_INCREMENTAL", "1") != "1"
+    ),
 }
 
 # Intersphinx mapping
@@ -110,23 +120,6 @@ numpydoc_validation_checks = {
     # type, unless multiple values are being returned"
 }
 
-# pyvista is not yet used for these examples but the sphinx build fails if it isn't configured
-pyvista.set_error_output_file("errors.txt")
-pyvista.OFF_SCREEN = True
-pyvista.BUILDING_GALLERY = True
-pyvista.rcParams["window_size"] = np.array([1024, 768])
-pyvista.FIGURE_PATH = os.path.join(os.path.abspath("./images/"), "auto-generated/")
-if not os.path.exists(pyvista.FIGURE_PATH):
-    os.makedirs(pyvista.FIGURE_PATH)
-
-# configure pymechanical for embedding
-ansys.mechanical.core.BUILDING_GALLERY = True
-app = ansys.mechanical.core.App(version=232)
-if "PYMECHANICAL_BUILDING_GALLERY_GITHUB" in os.environ:
-    config = app.ExtAPI.Application.SolveConfigurations["My Computer"]
-    config.SolveProcessSettings.MaxNumberOfCores = 1
-    config.SolveProcessSettings.DistributeSolution = False
-
 # static path
 html_static_path = ["_static"]
 
@@ -152,5 +145,92 @@ exclude_patterns = [
 # make rst_epilog a variable, so you can add other epilog parts to it
 rst_epilog = ""
 # Read link all targets from file
-with open("links.rst") as f:
-    rst_epilog += f.read()
+rst_epilog += (Path(__file__).parent / "links.rst").read_text()
+
+
+# -- Gallery build hooks ------------------------------------------------------
+# PyMechanical is only imported and Mechanical only started once the builder is
+# known, so builds that do not execute the examples skip them.
+# pyvista is configured for every builder because sphinx-gallery loads its
+# image scraper even when the examples are not executed.
+
+# Builders that do not render the examples output, so the examples are not executed
+no_plot_builders = {"doctest", "linkcheck", "spelling"}
+
+# Embedded Mechanical application shared by the examples
+app = None
+
+
+class ResetMechanicalApp:
+    """Clear the shared embedded Mechanical application before each example."""
+
+    def __repr__(self):
+        # Sphinx hashes the repr of ``sphinx_gallery_conf`` into ``.buildinfo``, so
+        # it must not change between builds for incremental builds to work.
+        return "ResetMechanicalApp"
+
+    def __call__(self, gallery_conf, fname):
+        app.new()
+
+
+# Examples share the application started in ``start_mechanical``
+sphinx_gallery_conf["reset_modules"] = ("matplotlib", ResetMechanicalApp())
+
+
+def configure_pyvista():
+    """Configure pyvista for the gallery image scraper."""
+    # pyvista is not yet used for these examples but the sphinx build fails if it isn't configured
+    import pyvista
+
+    pyvista.set_error_output_file("errors.txt")
+    pyvista.OFF_SCREEN = True
+    pyvista.BUILDING_GALLERY = True
+    pyvista.global_theme.window_size = (1024, 768)
+    pyvista.FIGURE_PATH = os.path.join(os.path.abspath("./images/"), "auto-generated/")
+    if not os.path.exists(pyvista.FIGURE_PATH):
+        os.makedirs(pyvista.FIGURE_PATH)
+
+
+def start_mechanical():
+    """Start the embedded Mechanical application shared by the examples."""
+    global app
+    import ansys.mechanical.core
+
+    # While BUILDING_GALLERY is set, every ``App`` created by an example attaches
+    # to this instance.
+    ansys.mechanical.core.BUILDING_GALLERY = True
+    app = ansys.mechanical.core.App(version=232)
+    # Keep the solver from competing for cores with the documentation build on CI
+    if "PYMECHANICAL_BUILDING_GALLERY_GITHUB" in os.environ:
+        config = app.ExtAPI.Application.SolveConfigurations["My Computer"]
+        config.SolveProcessSettings.MaxNumberOfCores = 1
+        config.SolveProcessSettings.DistributeSolution = False
+
+
+def configure_gallery(sphinx_app):
+    """Prepare the examples gallery for the current builder."""
+    configure_pyvista()
+    if sphinx_app.builder.name in no_plot_builders:
+        sphinx_app.config.plot_gallery = "False"
+        return
+    # ``-D plot_gallery=0`` builds the pages without executing the examples
+    if str(sphinx_app.config.plot_gallery).lower() in ("0", "false"):
+        return
+    start_mechanical()
+
+
+def remove_downloads(sphinx_app, exception):
+    """Remove the files downloaded by the examples."""
+    # Nothing was downloaded when the examples were not executed
+    if app is None:
+        return
+    from ansys.mechanical.core.examples import delete_downloads
+
+    delete_downloads()
+
+
+def setup(sphinx_app):
+    """Connect the documentation build hooks."""
+    # Run before sphinx-gallery generates the examples on ``builder-inited``
+    sphinx_app.connect("builder-inited", configure_gallery, priority=100)
+    sphinx_app.connect("build-finished", remove_downloads)
@@ -5,9 +5,10 @@ Created on Thu Jan 12 17:06:18 2023
 @author: pmaroneh
 """
 import os
+from pathlib import Path
 
 import ansys.mechanical.core as mech
-from ansys.mechanical.core.examples import delete_downloads, download_file
+from ansys.mechanical.core.examples import download_file
 
 # Embed Mechanical and set global variables
 
@@ -15,33 +16,31 @@ app = mech.App(version=232)
 globals().update(mech.global_variables(app))
 print(app)
 
+# Resolve the enumerations namespace once instead of on every use
+Enums = Ansys.Mechanical.DataModel.Enums
+
 geometry_path = download_file("Valve.pmdb", "pymechanical", "embedding")
 analysis = Model.AddStaticStructuralAnalysis()
 
-cwd = os.path.join(os.getcwd(), "out")
+cwd = Path.cwd() / "out"
+cwd.mkdir(exist_ok=True)
 
 # Configure graphics for image export
-ExtAPI.Graphics.Camera.SetSpecificViewOrientation(
-    Ansys.Mechanical.DataModel.Enums.ViewOrientationType.Iso
-)
+ExtAPI.Graphics.Camera.SetSpecificViewOrientation(Enums.ViewOrientationType.Iso)
 ExtAPI.Graphics.Camera.SetFit()
-image_export_format = Ansys.Mechanical.DataModel.Enums.GraphicsImageExportFormat.PNG
+image_export_format = Enums.GraphicsImageExportFormat.PNG
 settings_720p = Ansys.Mechanical.Graphics.GraphicsImageExportSettings()
-settings_720p.Resolution = (
-    Ansys.Mechanical.DataModel.Enums.GraphicsResolutionType.EnhancedResolution
-)
-settings_720p.Background = Ansys.Mechanical.DataModel.Enums.GraphicsBackgroundType.White
+settings_720p.Resolution = Enums.GraphicsResolutionType.EnhancedResolution
+settings_720p.Background = Enums.GraphicsBackgroundType.White
 settings_720p.Width = 1280
-settings_720p.Capture = Ansys.Mechanical.DataModel.Enums.GraphicsCaptureType.ImageOnly
+settings_720p.Capture = Enums.GraphicsCaptureType.ImageOnly
 settings_720p.Height = 720
 settings_720p.CurrentGraphicsDisplay = False
 
 # Import geometry
 geometry_file = geometry_path
 geometry_import = Model.GeometryImportGroup.AddGeometryImport()
-geometry_import_format = (
-    Ansys.Mechanical.DataModel.Enums.GeometryImportPreference.Format.Automatic
-)
+geometry_import_format = Enums.GeometryImportPreference.Format.Automatic
 geometry_import_preferences = Ansys.ACT.Mechanical.Utilities.GeometryImportPreferences()
 geometry_import_preferences.ProcessNamedSelections = True
 geometry_import.Import(
@@ -49,7 +48,7 @@ geometry_import.Import(
 )
 
 ExtAPI.Graphics.ExportImage(
-    os.path.join(cwd, "geometry.png"), image_export_format, settings_720p
+    str(cwd / "geometry.png"), image_export_format, settings_720p
 )
 
 # Assign materials
@@ -60,9 +59,7 @@ sel = ExtAPI.SelectionManager.CreateSelectionInfo(
 )
 sel.Ids = [
     body.GetGeoBody().Id
-    for body in Model.Geometry.GetChildren(
-        Ansys.Mechanical.DataModel.Enums.DataModelObjectCategory.Body, True
-    )
+    for body in Model.Geometry.GetChildren(Enums.DataModelObjectCategory.Body, True)
 ]
 material_assignment.Location = sel
 
@@ -71,9 +68,7 @@ mesh = Model.Mesh
 mesh.ElementSize = Quantity(25, "mm")
 mesh.GenerateMesh()
 Tree.Activate([mesh])
-ExtAPI.Graphics.ExportImage(
-    os.path.join(cwd, "mesh.png"), image_export_format, settings_720p
-)
+ExtAPI.Graphics.ExportImage(str(cwd / "mesh.png"), image_export_format, settings_720p)
 
 # Define boundary conditions
 
@@ -92,9 +87,6 @@ pressure.Magnitude.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s
 pressure.Magnitude.Output.DiscreteValues = [Quantity("0 [Pa]"), Quantity("15 [MPa]")]
 
 # Solve model
-config = ExtAPI.Application.SolveConfigurations["My Computer"]
-config.SolveProcessSettings.MaxNumberOfCores = 1
-config.SolveProcessSettings.DistributeSolution = False
 Model.Solve()
 
 # Evaluate results, export screenshots
@@ -105,28 +97,22 @@ solution.EvaluateAllResults()
 
 Tree.Activate([deformation])
 ExtAPI.Graphics.ExportImage(
-    os.path.join(cwd, "deformation.png"), image_export_format, settings_720p
+    str(cwd / "deformation.png"), image_export_format, settings_720p
 )
 Tree.Activate([stress])
-ExtAPI.Graphics.ExportImage(
-    os.path.join(cwd, "stress.png"), image_export_format, settings_720p
-)
+ExtAPI.Graphics.ExportImage(str(cwd / "stress.png"), image_export_format, settings_720p)
 
 # Export stress animation
-animation_export_format = (
-    Ansys.Mechanical.DataModel.Enums.GraphicsAnimationExportFormat.MP4
-)
-settings_720p = Ansys.Mechanical.Graphics.AnimationExportSettings()
-settings_720p.Width = 1280
-settings_720p.Height = 720
-
-stress.ExportAnimation(
-    os.path.join(cwd, "Valve.mp4"), animation_export_format, settings_720p
-)
+# Set PYMECHANICAL_EXPORT_ANIMATION=0 to skip this step, which renders every frame
+if os.environ.get("PYMECHANICAL_EXPORT_ANIMATION", "1") == "1":
+    animation_export_format = Enums.GraphicsAnimationExportFormat.MP4
+    animation_settings_720p = Ansys.Mechanical.Graphics.AnimationExportSettings()
+    animation_settings_720p.Width = 1280
+    animation_settings_720p.Height = 720
+
+    stress.ExportAnimation(
+        str(cwd / "Valve.mp4"), animation_export_format, animation_settings_720p
+    )
 
 # Save project
-app.save(os.path.join(cwd, "Valve.mechdat"))
-app.new()
-
-# delete example file
-delete_downloads()
+app.save(str(cwd / "Valve.mechdat"))